@@ -48,7 +48,7 @@ resource "aws_dynamodb_table" "audit_trail" {
   billing_mode = "PAY_PER_REQUEST" # On-demand for variable workloads
 
   hash_key  = "pk"           # Partition key: ORG#<org-id>
-  range_key = "sk"           # Sort key: EVENT#<timestamp>#<event-type>
+  range_key = "sk"           # Sort key: FILE#<file-key>#<id>, one item per file
 
   attribute {
     name = "pk"
@@ -78,7 +78,7 @@ resource "aws_dynamodb_table" "audit_trail" {
     projection_type = "ALL"
   }
 
-  # Global Secondary Index for querying by event type
+  # Global Secondary Index for querying by latest event type
   global_secondary_index {
     name            = "event-type-index"
     hash_key        = "event_type"
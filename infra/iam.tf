@@ -82,6 +82,7 @@ resource "aws_iam_role_policy" "lambda_dynamodb" {
         Effect = "Allow"
         Action = [
           "dynamodb:PutItem",
+          "dynamodb:BatchWriteItem",
           "dynamodb:UpdateItem",
           "dynamodb:GetItem"
         ]
@@ -89,6 +90,13 @@ resource "aws_iam_role_policy" "lambda_dynamodb" {
           aws_dynamodb_table.audit_trail.arn,
           "${aws_dynamodb_table.audit_trail.arn}/index/*"
         ]
+      },
+      {
+        Effect = "Allow"
+        Action = [
+          "dynamodb:DescribeEndpoints"
+        ]
+        Resource = "*"
       }
     ]
   })
@@ -106,7 +114,8 @@ resource "aws_iam_role_policy" "lambda_ecs" {
         Effect = "Allow"
         Action = [
           "ecs:RunTask",
-          "ecs:TagResource"
+          "ecs:TagResource",
+          "ecs:ListClusters"
         ]
         Resource = "*"
       },
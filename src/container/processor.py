@@ -5,14 +5,15 @@ This container processes data packages uploaded to S3.
 
 """
 
+import functools
 import os
 import sys
 import logging
+import time
 import uuid
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Callable, Literal
 
-import boto3
 from botocore.exceptions import ClientError
 
 # Configure logging
@@ -31,9 +32,56 @@ FILE_SIZE = os.environ.get("FILE_SIZE", "0")
 AUDIT_TABLE_NAME = os.environ.get("AUDIT_TABLE_NAME")
 AWS_REGION_NAME = os.environ.get("AWS_REGION_NAME", "us-east-1")
 
-# AWS clients
-dynamodb = boto3.resource("dynamodb", region_name=AWS_REGION_NAME)
-s3_client = boto3.client("s3", region_name=AWS_REGION_NAME)
+# Sort key of the file's audit item, created by the validation Lambda
+AUDIT_SK = os.environ.get("AUDIT_SK")
+
+# Required configuration, checked once before any AWS client is created
+_MISSING_CONFIG = tuple(
+    name for name, value in (
+        ("S3_BUCKET", S3_BUCKET),
+        ("S3_KEY", S3_KEY),
+        ("ORGANIZATION_ID", ORGANIZATION_ID),
+        ("AUDIT_TABLE_NAME", AUDIT_TABLE_NAME),
+    )
+    if not value
+)
+
+# Optional S3 access check; FILE_SIZE is already validated by the Lambda
+VERIFY_S3_ACCESS = os.environ.get("VERIFY_S3_ACCESS") == "1"
+
+# Optional artificial delay for orchestration testing (disabled by default)
+try:
+    SIMULATED_DELAY_SECONDS = float(os.environ.get("SIMULATED_DELAY_SECONDS", "0"))
+except ValueError:
+    logger.warning(
+        "Ignoring invalid SIMULATED_DELAY_SECONDS: %r",
+        os.environ.get("SIMULATED_DELAY_SECONDS")
+    )
+    SIMULATED_DELAY_SECONDS = 0.0
+
+
+@functools.lru_cache(maxsize=1)
+def _get_clients() -> tuple[Any, Any]:
+    """
+    Create the DynamoDB client and item serializer on first use.
+    
+    boto3 is imported lazily to keep container start-up fast.
+    
+    Returns:
+        Tuple of (dynamodb_client, type_serializer)
+    """
+    import boto3
+    from boto3.dynamodb.types import TypeSerializer
+    
+    return boto3.client("dynamodb", region_name=AWS_REGION_NAME), TypeSerializer()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_s3_client() -> Any:
+    """Create the S3 client on first use (only needed with VERIFY_S3_ACCESS)."""
+    import boto3
+    
+    return boto3.client("s3", region_name=AWS_REGION_NAME)
 
 
 def get_iso_timestamp() -> str:
@@ -43,7 +91,116 @@ def get_iso_timestamp() -> str:
 
 def generate_event_id() -> str:
     """Generate a unique event ID."""
-    return str(uuid.uuid4())
+    return uuid.uuid4().hex
+
+
+def generate_audit_sk(file_key: str) -> str:
+    """Generate the sort key of the audit item for a file."""
+    return f"FILE#{file_key}#{generate_event_id()}"
+
+
+@functools.lru_cache(maxsize=1)
+def _make_emitter(
+    organization_id: str,
+    file_key: str,
+    audit_sk: str
+) -> Callable[..., None]:
+    """
+    Build an audit event emitter bound to one file's audit item.
+    
+    The item key and file_key are serialized once; each emitted event only
+    serializes its own fields. Emitters are cached, so repeated calls for the
+    same file share one.
+    
+    Args:
+        organization_id: The organization identifier
+        file_key: S3 key of the file being processed
+        audit_sk: Sort key of the file's audit item
+        
+    Returns:
+        emit(event_type, details, status="SUCCESS", mode="append")
+    """
+    dynamodb_client, serializer = _get_clients()
+    
+    item_key = {
+        "pk": serializer.serialize(f"ORG#{organization_id}"),
+        "sk": serializer.serialize(audit_sk),
+    }
+    file_key_value = serializer.serialize(file_key)
+    
+    def emit(
+        event_type: str,
+        details: dict[str, Any],
+        status: str = "SUCCESS",
+        mode: Literal["create", "append"] = "append"
+    ) -> None:
+        try:
+            timestamp = get_iso_timestamp()
+            
+            event = serializer.serialize({
+                "event_id": generate_event_id(),
+                "event_type": event_type,
+                "timestamp": timestamp,
+                "status": status,
+                "details": details,
+            })
+            
+            # Top-level attributes reuse the event's serialized values
+            event_type_value = event["M"]["event_type"]
+            timestamp_value = event["M"]["timestamp"]
+            status_value = event["M"]["status"]
+            
+            if mode == "append":
+                try:
+                    dynamodb_client.update_item(
+                        TableName=AUDIT_TABLE_NAME,
+                        Key=item_key,
+                        UpdateExpression=(
+                            "SET events = list_append(events, :e), "
+                            "event_type = :t, #ts = :ts, #status = :s"
+                        ),
+                        ConditionExpression="attribute_exists(sk)",
+                        ExpressionAttributeNames={"#ts": "timestamp", "#status": "status"},
+                        ExpressionAttributeValues={
+                            ":e": {"L": [event]},
+                            ":t": event_type_value,
+                            ":ts": timestamp_value,
+                            ":s": status_value,
+                        },
+                    )
+                except ClientError as e:
+                    if e.response.get("Error", {}).get("Code") != "ConditionalCheckFailedException":
+                        raise
+                    
+                    # The Lambda writes the item before starting the task, so
+                    # a missing item means this task was not started from it.
+                    # Record to a new item rather than blocking processing.
+                    logger.warning(
+                        "Audit item %s not found; recording events in a new item", audit_sk
+                    )
+                    item_key["sk"] = serializer.serialize(generate_audit_sk(file_key))
+                    mode = "create"
+            
+            if mode == "create":
+                dynamodb_client.put_item(
+                    TableName=AUDIT_TABLE_NAME,
+                    Item={
+                        **item_key,
+                        "file_key": file_key_value,
+                        "event_type": event_type_value,
+                        "timestamp": timestamp_value,
+                        "status": status_value,
+                        "events": {"L": [event]},
+                    },
+                )
+            
+            logger.info("Recorded audit event: %s for %s", event_type, file_key)
+            
+        except ClientError as e:
+            logger.error("Failed to record audit event: %s", e)
+            raise
+    
+    return emit
 
 
 def record_audit_event(
@@ -51,40 +208,29 @@ def record_audit_event(
     event_type: str,
     file_key: str,
     details: dict[str, Any],
-    status: str = "SUCCESS"
+    status: str = "SUCCESS",
+    audit_sk: str | None = None,
+    mode: Literal["create", "append"] = "append"
 ) -> None:
     """
     Record an event in the audit trail.
     
+    All events of a file are stored in the events list of a single item.
+    The top-level event_type, status and timestamp reflect the latest event.
+    Use _make_emitter() when recording several events for the same file.
+    
     Args:
         organization_id: The organization identifier
         event_type: Type of event
         file_key: S3 key of the file being processed
         details: Additional event details
         status: Event status (SUCCESS, FAILURE)
+        audit_sk: Sort key of the file's audit item (defaults to AUDIT_SK)
+        mode: "create" writes a new item, "append" adds the event to the
+            existing item (or to a new item if it does not exist)
     """
-    try:
-        table = dynamodb.Table(AUDIT_TABLE_NAME)
-        timestamp = get_iso_timestamp()
-        event_id = generate_event_id()
-        
-        item = {
-            "pk": f"ORG#{organization_id}",
-            "sk": f"EVENT#{timestamp}#{event_type}",
-            "event_id": event_id,
-            "event_type": event_type,
-            "file_key": file_key,
-            "timestamp": timestamp,
-            "status": status,
-            "details": details,
-        }
-        
-        table.put_item(Item=item)
-        logger.info(f"Recorded audit event: {event_type} for {file_key}")
-        
-    except ClientError as e:
-        logger.error(f"Failed to record audit event: {e}")
-        raise
+    emit = _make_emitter(organization_id, file_key, audit_sk or AUDIT_SK)
+    emit(event_type, details, status=status, mode=mode)
 
 
 def process_data_package() -> None:
@@ -95,57 +241,77 @@ def process_data_package() -> None:
     logger.info("DATA PACKAGE PROCESSOR - STARTING")
     
     # Log configuration
-    logger.info(f"S3 Bucket: {S3_BUCKET}")
-    logger.info(f"S3 Key: {S3_KEY}")
-    logger.info(f"Organization ID: {ORGANIZATION_ID}")
-    logger.info(f"File Size: {FILE_SIZE} bytes")
-    logger.info(f"Audit Table: {AUDIT_TABLE_NAME}")   
+    logger.info("S3 Bucket: %s", S3_BUCKET)
+    logger.info("S3 Key: %s", S3_KEY)
+    logger.info("Organization ID: %s", ORGANIZATION_ID)
+    logger.info("File Size: %s bytes", FILE_SIZE)
+    logger.info("Audit Table: %s", AUDIT_TABLE_NAME)   
     
     # Validate required environment variables
-    if not all([S3_BUCKET, S3_KEY, ORGANIZATION_ID, AUDIT_TABLE_NAME]):
-        logger.error("Missing required environment variables")
-        record_audit_event(
-            organization_id=ORGANIZATION_ID or "UNKNOWN",
-            event_type="PROCESSING_ERROR",
-            file_key=S3_KEY or "UNKNOWN",
-            details={"error": "Missing required environment variables"},
-            status="FAILURE"
-        )
+    if _MISSING_CONFIG:
+        logger.error("Missing required environment variables: %s", ", ".join(_MISSING_CONFIG))
+        
+        # Without an audit table the failure can only be logged. The Lambda's
+        # item cannot be addressed with incomplete config, so a new item is
+        # written in a single request.
+        if AUDIT_TABLE_NAME:
+            try:
+                record_audit_event(
+                    organization_id=ORGANIZATION_ID or "UNKNOWN",
+                    event_type="PROCESSING_ERROR",
+                    file_key=S3_KEY or "UNKNOWN",
+                    details={
+                        "error": "Missing required environment variables",
+                        "missing": list(_MISSING_CONFIG),
+                        "lambda_audit_sk": AUDIT_SK,
+                    },
+                    status="FAILURE",
+                    audit_sk=generate_audit_sk(S3_KEY or "UNKNOWN"),
+                    mode="create"
+                )
+            except Exception as e:
+                logger.error("Failed to record configuration error: %s", e)
         sys.exit(1)
     
+    # Append to the Lambda's audit item, or start a new one when run standalone
+    audit_sk = AUDIT_SK or generate_audit_sk(S3_KEY)
+    audit_mode = "append" if AUDIT_SK else "create"
+    
+    emit = _make_emitter(ORGANIZATION_ID, S3_KEY, audit_sk)
+    
     try:
         # Record processing in progress
         logger.info("Recording processing start in audit trail...")
-        record_audit_event(
-            organization_id=ORGANIZATION_ID,
+        emit(
             event_type="PROCESSING_IN_PROGRESS",
-            file_key=S3_KEY,
             details={
                 "bucket": S3_BUCKET,
                 "file_size": FILE_SIZE,
                 "status": "Processing data package",
-            }
+            },
+            mode=audit_mode
         )
         
         # PROTOTYPE PROCESSING LOGIC
                 
         logger.info("PROCESSING DATA PACKAGE")
-        logger.info(f"  File Name: {S3_KEY}")
-        logger.info(f"  File Size: {FILE_SIZE} bytes")
-        logger.info(f"  Organization: {ORGANIZATION_ID}")
+        logger.info("  File Name: %s", S3_KEY)
+        logger.info("  File Size: %s bytes", FILE_SIZE)
+        logger.info("  Organization: %s", ORGANIZATION_ID)
         
         # Verify we can access the file
-        try:
-            head_response = s3_client.head_object(Bucket=S3_BUCKET, Key=S3_KEY)
-            actual_size = head_response.get("ContentLength", 0)
-            logger.info(f"Verified file access. Actual size: {actual_size} bytes")
-        except ClientError as e:
-            logger.warning(f"Could not verify file access: {e}")
+        if VERIFY_S3_ACCESS:
+            try:
+                head_response = _get_s3_client().head_object(Bucket=S3_BUCKET, Key=S3_KEY)
+                actual_size = head_response.get("ContentLength", 0)
+                logger.info("Verified file access. Actual size: %s bytes", actual_size)
+            except ClientError as e:
+                logger.warning("Could not verify file access: %s", e)
         
         # Simulate processing time
-        import time
-        logger.info("Simulating processing... (2 seconds)")
-        time.sleep(2)
+        if SIMULATED_DELAY_SECONDS > 0:
+            logger.info("Simulating processing... (%s seconds)", SIMULATED_DELAY_SECONDS)
+            time.sleep(SIMULATED_DELAY_SECONDS)
         
         # Processing complete
         logger.info("Processing completed successfully!")
@@ -153,10 +319,8 @@ def process_data_package() -> None:
         # END PROTOTYPE PROCESSING LOGIC
             
         # Record successful completion
-        record_audit_event(
-            organization_id=ORGANIZATION_ID,
+        emit(
             event_type="PROCESSING_COMPLETE",
-            file_key=S3_KEY,
             details={
                 "bucket": S3_BUCKET,
                 "file_size": FILE_SIZE,
@@ -168,21 +332,22 @@ def process_data_package() -> None:
         logger.info("DATA PACKAGE PROCESSOR - COMPLETED SUCCESSFULLY")
         
     except Exception as e:
-        logger.error(f"Processing failed: {e}")
+        logger.error("Processing failed: %s", e)
         
-        # Record failure
-        record_audit_event(
-            organization_id=ORGANIZATION_ID,
-            event_type="PROCESSING_COMPLETE",
-            file_key=S3_KEY,
-            details={
-                "bucket": S3_BUCKET,
-                "file_size": FILE_SIZE,
-                "result": "FAILURE",
-                "error": str(e),
-            },
-            status="FAILURE"
-        )
+        # Record failure; an audit error must not prevent the exit below
+        try:
+            emit(
+                event_type="PROCESSING_COMPLETE",
+                details={
+                    "bucket": S3_BUCKET,
+                    "file_size": FILE_SIZE,
+                    "result": "FAILURE",
+                    "error": str(e),
+                },
+                status="FAILURE"
+            )
+        except Exception as audit_error:
+            logger.error("Failed to record processing failure: %s", audit_error)
         
         logger.info("DATA PACKAGE PROCESSOR - FAILED")
         
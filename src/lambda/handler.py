@@ -8,18 +8,23 @@ Workflow:
 1. Receive S3 event notification
 2. Validate organization-id tag exists and is authorized
 3. Check basic metadata requirements (file size, extension)
-4. Record validation event in audit trail
+4. Record the file's events as a single item in the audit trail
 5. Trigger ECS task for processing if validation passes
 """
 
 import json
 import os
+import concurrent.futures
 import logging
+import time
+import urllib.parse
 import uuid
 from datetime import datetime, timezone
 from typing import Any
 
 import boto3
+from boto3.dynamodb.types import TypeSerializer
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 # Configure logging
@@ -32,14 +37,59 @@ ECS_CLUSTER_ARN = os.environ.get("ECS_CLUSTER_ARN")
 ECS_TASK_DEFINITION_ARN = os.environ.get("ECS_TASK_DEFINITION_ARN")
 ECS_SUBNET_IDS = os.environ.get("ECS_SUBNET_IDS", "").split(",")
 ECS_SECURITY_GROUP_ID = os.environ.get("ECS_SECURITY_GROUP_ID")
-ALLOWED_ORGANIZATION_IDS = os.environ.get("ALLOWED_ORGANIZATION_IDS", "").split(",")
+ALLOWED_ORGANIZATION_IDS = frozenset(
+    org_id.strip()
+    for org_id in os.environ.get("ALLOWED_ORGANIZATION_IDS", "").split(",")
+    if org_id.strip()
+)
 INGRESS_BUCKET_NAME = os.environ.get("INGRESS_BUCKET_NAME")
 AWS_REGION_NAME = os.environ.get("AWS_REGION_NAME", "us-east-1")
 
-# AWS clients
-s3_client = boto3.client("s3", region_name=AWS_REGION_NAME)
-dynamodb = boto3.resource("dynamodb", region_name=AWS_REGION_NAME)
-ecs_client = boto3.client("ecs", region_name=AWS_REGION_NAME)
+# Validation rules
+MAX_FILE_SIZE = 1024 * 1024 * 1024  # 1 GB
+
+# Maximum number of S3 records processed concurrently per invocation
+MAX_RECORD_WORKERS = 16
+
+# AWS clients (each record worker may hold two S3 connections at once)
+BOTO_CONFIG = Config(
+    max_pool_connections=2 * MAX_RECORD_WORKERS,
+    retries={"max_attempts": 3, "mode": "adaptive"},
+)
+s3_client = boto3.client("s3", region_name=AWS_REGION_NAME, config=BOTO_CONFIG)
+dynamodb_client = boto3.client("dynamodb", region_name=AWS_REGION_NAME, config=BOTO_CONFIG)
+ecs_client = boto3.client("ecs", region_name=AWS_REGION_NAME, config=BOTO_CONFIG)
+
+# Warm up connection pools during the init phase so the first request in
+# the handler reuses an established TLS connection
+try:
+    dynamodb_client.describe_endpoints()
+    if INGRESS_BUCKET_NAME:
+        s3_client.head_bucket(Bucket=INGRESS_BUCKET_NAME)
+    ecs_client.list_clusters(maxResults=1)
+except Exception as e:
+    logger.warning("Connection warm-up failed: %s", e)
+
+# Resources reused across warm invocations
+_TYPE_SERIALIZER = TypeSerializer()
+
+_NETWORK_CONFIG = {
+    "awsvpcConfiguration": {
+        "subnets": ECS_SUBNET_IDS,
+        "securityGroups": [ECS_SECURITY_GROUP_ID],
+        "assignPublicIp": "ENABLED"  # Required for Fargate in public subnets
+    }
+}
+
+# Reused across warm invocations to overlap independent S3 requests
+_S3_EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=2 * MAX_RECORD_WORKERS)
+
+# Audit items buffered during an invocation, flushed with BatchWriteItem
+_AUDIT_BUFFER: list[dict] = []
+
+# BatchWriteItem accepts at most 25 put requests per call
+AUDIT_BATCH_SIZE = 25
+AUDIT_FLUSH_MAX_ATTEMPTS = 5
 
 
 class ValidationError(Exception):
@@ -54,69 +104,205 @@ def get_iso_timestamp() -> str:
 
 def generate_event_id() -> str:
     """Generate a unique event ID."""
-    return str(uuid.uuid4())
+    return uuid.uuid4().hex
+
+
+def generate_audit_sk(file_key: str) -> str:
+    """Generate the sort key of the audit item for a file."""
+    return f"FILE#{file_key}#{generate_event_id()}"
+
+
+def build_audit_event(
+    event_type: str,
+    details: dict[str, Any],
+    status: str = "SUCCESS",
+    timestamp: str | None = None
+) -> dict:
+    """
+    Build an entry for the events list of an audit item.
+    
+    Args:
+        event_type: Type of event (UPLOAD, VALIDATION, PROCESSING_START, ERROR)
+        details: Additional event details
+        status: Event status (SUCCESS, FAILURE)
+        timestamp: Event timestamp, shared by all events of a record (defaults to now)
+    """
+    return {
+        "event_id": generate_event_id(),
+        "event_type": event_type,
+        "timestamp": timestamp or get_iso_timestamp(),
+        "status": status,
+        "details": details,
+    }
 
 
 def record_audit_event(
     organization_id: str,
-    event_type: str,
     file_key: str,
-    details: dict[str, Any],
-    status: str = "SUCCESS"
+    audit_sk: str,
+    events: list[dict]
 ) -> None:
     """
-    Record an event in the audit trail.
+    Record the audit item for a file.
+    
+    All events of a file are stored in a single item. The top-level
+    event_type, status and timestamp reflect the latest event; the processing
+    container appends its own events to the same item.
+    
+    Successful items are buffered and written by flush_audit_events() before
+    any processing task is started, so the item exists before the container
+    appends to it. Items ending in a FAILURE event are written immediately.
     
     Args:
         organization_id: The organization identifier
-        event_type: Type of event (UPLOAD, VALIDATION, PROCESSING_START, PROCESSING_COMPLETE)
         file_key: S3 key of the file being processed
-        details: Additional event details
-        status: Event status (SUCCESS, FAILURE)
+        audit_sk: Sort key of the audit item (see generate_audit_sk)
+        events: Events built with build_audit_event, oldest first
     """
     try:
-        table = dynamodb.Table(AUDIT_TABLE_NAME)
-        timestamp = get_iso_timestamp()
-        event_id = generate_event_id()
+        latest = events[-1]
         
         item = {
             "pk": f"ORG#{organization_id}",
-            "sk": f"EVENT#{timestamp}#{event_type}",
-            "event_id": event_id,
-            "event_type": event_type,
+            "sk": audit_sk,
             "file_key": file_key,
-            "timestamp": timestamp,
-            "status": status,
-            "details": details,
+            "event_type": latest["event_type"],
+            "timestamp": latest["timestamp"],
+            "status": latest["status"],
+            "events": events,
         }
         
-        table.put_item(Item=item)
-        logger.info(f"Recorded audit event: {event_type} for {file_key}")
+        marshaled = {k: _TYPE_SERIALIZER.serialize(v) for k, v in item.items()}
+        
+        if latest["status"] == "FAILURE":
+            dynamodb_client.put_item(TableName=AUDIT_TABLE_NAME, Item=marshaled)
+            logger.info("Recorded audit item: %s for %s", latest["event_type"], file_key)
+        else:
+            _AUDIT_BUFFER.append(marshaled)
+            logger.info("Buffered audit item: %s for %s", latest["event_type"], file_key)
         
     except ClientError as e:
-        logger.error(f"Failed to record audit event: {e}")
+        logger.error("Failed to record audit event: %s", e)
         raise
 
 
+def append_audit_event(
+    organization_id: str,
+    file_key: str,
+    audit_sk: str,
+    event: dict
+) -> None:
+    """
+    Append an event to a file's existing audit item.
+    
+    Args:
+        organization_id: The organization identifier
+        file_key: S3 key of the file being processed
+        audit_sk: Sort key of the audit item
+        event: Event built with build_audit_event
+    """
+    try:
+        marshaled = _TYPE_SERIALIZER.serialize(event)
+        
+        dynamodb_client.update_item(
+            TableName=AUDIT_TABLE_NAME,
+            Key={
+                "pk": _TYPE_SERIALIZER.serialize(f"ORG#{organization_id}"),
+                "sk": _TYPE_SERIALIZER.serialize(audit_sk),
+            },
+            UpdateExpression=(
+                "SET events = list_append(events, :e), "
+                "event_type = :t, #ts = :ts, #status = :s"
+            ),
+            ConditionExpression="attribute_exists(sk)",
+            ExpressionAttributeNames={"#ts": "timestamp", "#status": "status"},
+            ExpressionAttributeValues={
+                ":e": {"L": [marshaled]},
+                ":t": marshaled["M"]["event_type"],
+                ":ts": marshaled["M"]["timestamp"],
+                ":s": marshaled["M"]["status"],
+            },
+        )
+        logger.info("Recorded audit event: %s for %s", event["event_type"], file_key)
+        
+    except ClientError as e:
+        logger.error("Failed to record audit event: %s", e)
+        raise
+
+
+def flush_audit_events() -> list[dict]:
+    """
+    Write all buffered audit items to the audit trail.
+    
+    Items are sent in chunks of up to 25 items per BatchWriteItem call.
+    UnprocessedItems returned by DynamoDB are retried with exponential backoff.
+    Every chunk is attempted even if an earlier one fails, and the buffer is
+    always left empty.
+    
+    Returns:
+        Items that could not be written
+    """
+    failed = []
+    
+    while _AUDIT_BUFFER:
+        chunk = _AUDIT_BUFFER[:AUDIT_BATCH_SIZE]
+        del _AUDIT_BUFFER[:AUDIT_BATCH_SIZE]
+        
+        request_items = {
+            AUDIT_TABLE_NAME: [{"PutRequest": {"Item": item}} for item in chunk]
+        }
+        
+        try:
+            for attempt in range(AUDIT_FLUSH_MAX_ATTEMPTS):
+                if attempt:
+                    time.sleep(min(0.05 * 2 ** attempt, 1.0))
+                
+                response = dynamodb_client.batch_write_item(RequestItems=request_items)
+                request_items = response.get("UnprocessedItems")
+                
+                if not request_items:
+                    break
+        except Exception as e:
+            logger.error("Failed to flush audit items: %s", e)
+        
+        unflushed = [
+            request["PutRequest"]["Item"]
+            for request in (request_items or {}).get(AUDIT_TABLE_NAME, [])
+        ]
+        failed.extend(unflushed)
+        logger.info("Flushed %d audit items", len(chunk) - len(unflushed))
+    
+    if failed:
+        logger.error(
+            "%d audit items could not be written: %s",
+            len(failed), ", ".join(item["sk"]["S"] for item in failed)
+        )
+    
+    return failed
+
+
 def get_object_metadata(bucket: str, key: str) -> tuple[dict, dict]:
     """
     Get S3 object metadata and tags.
     
+    The head_object and get_object_tagging requests are independent, so
+    they are issued concurrently.
+    
     Returns:
         Tuple of (head_object_response, tags_dict)
     """
     try:
-        # Get object metadata
-        head_response = s3_client.head_object(Bucket=bucket, Key=key)
+        head_future = _S3_EXECUTOR.submit(s3_client.head_object, Bucket=bucket, Key=key)
+        tags_future = _S3_EXECUTOR.submit(s3_client.get_object_tagging, Bucket=bucket, Key=key)
         
-        # Get object tags
-        tags_response = s3_client.get_object_tagging(Bucket=bucket, Key=key)
+        head_response = head_future.result()
+        tags_response = tags_future.result()
         tags = {tag["Key"]: tag["Value"] for tag in tags_response.get("TagSet", [])}
         
         return head_response, tags
         
     except ClientError as e:
-        logger.error(f"Failed to get object metadata: {e}")
+        logger.error("Failed to get object metadata: %s", e)
         raise
 
 
@@ -171,14 +357,13 @@ def validate_file_requirements(head_response: dict, key: str) -> dict:
     file_size = head_response.get("ContentLength", 0)
     content_type = head_response.get("ContentType", "")
     
-    # Check file extension
-    if not key.lower().endswith(".zip"):
+    # Check file extension (only the suffix is lowercased, not the whole key)
+    if key[-4:].lower() != ".zip":
         raise ValidationError(f"Invalid file extension. Expected .zip, got: {key}")
     
-    # Check file size (example: max 1GB)
-    max_size = 1024 * 1024 * 1024  # 1 GB
-    if file_size > max_size:
-        raise ValidationError(f"File too large: {file_size} bytes (max: {max_size})")
+    # Check file size
+    if file_size > MAX_FILE_SIZE:
+        raise ValidationError(f"File too large: {file_size} bytes (max: {MAX_FILE_SIZE})")
     
     # Check minimum size (must have some content)
     if file_size == 0:
@@ -195,7 +380,8 @@ def trigger_processing_task(
     bucket: str,
     key: str,
     organization_id: str,
-    file_metadata: dict
+    file_metadata: dict,
+    audit_sk: str
 ) -> str:
     """
     Trigger the ECS processing task.
@@ -205,6 +391,7 @@ def trigger_processing_task(
         key: S3 object key
         organization_id: Organization identifier
         file_metadata: File metadata dict
+        audit_sk: Sort key of the file's audit item, for the container to append to
         
     Returns:
         ECS task ARN
@@ -214,13 +401,7 @@ def trigger_processing_task(
             cluster=ECS_CLUSTER_ARN,
             taskDefinition=ECS_TASK_DEFINITION_ARN,
             launchType="FARGATE",
-            networkConfiguration={
-                "awsvpcConfiguration": {
-                    "subnets": ECS_SUBNET_IDS,
-                    "securityGroups": [ECS_SECURITY_GROUP_ID],
-                    "assignPublicIp": "ENABLED"  # Required for Fargate in public subnets
-                }
-            },
+            networkConfiguration=_NETWORK_CONFIG,
             overrides={
                 "containerOverrides": [
                     {
@@ -230,6 +411,7 @@ def trigger_processing_task(
                             {"name": "S3_KEY", "value": key},
                             {"name": "ORGANIZATION_ID", "value": organization_id},
                             {"name": "FILE_SIZE", "value": str(file_metadata["file_size"])},
+                            {"name": "AUDIT_SK", "value": audit_sk},
                         ]
                     }
                 ]
@@ -246,146 +428,282 @@ def trigger_processing_task(
             failures = response.get("failures", [])
             raise Exception(f"Failed to start task: {failures}")
         
-        logger.info(f"Started ECS task: {task_arn}")
+        logger.info("Started ECS task: %s", task_arn)
         return task_arn
         
     except ClientError as e:
-        logger.error(f"Failed to trigger ECS task: {e}")
+        logger.error("Failed to trigger ECS task: %s", e)
         raise
 
 
-def lambda_handler(event: dict, context: Any) -> dict:
+def _record_failure_audit(
+    organization_id: str,
+    file_key: str,
+    audit_sk: str,
+    events: list[dict]
+) -> None:
     """
-    Main Lambda handler for S3 event processing.
+    Record a failed file's audit item without raising.
+    
+    A failed audit write is logged so that one record cannot abort the
+    other records of the invocation, whose tasks may already be running.
+    """
+    try:
+        record_audit_event(organization_id, file_key, audit_sk, events)
+    except Exception as e:
+        logger.error("Audit trail not recorded for %s: %s", file_key, e)
+
+
+def _validate_record(record: dict) -> dict | None:
+    """
+    Validate a single S3 event record and buffer its audit item.
     
     Args:
-        event: S3 event notification
-        context: Lambda context
+        record: S3 event record
         
     Returns:
-        Response dict with processing status
+        Result entry for the handler response, or None if the record is
+        skipped. Records that pass validation get status VALIDATED and carry
+        the state needed by _start_processing().
     """
-    logger.info(f"Received event: {json.dumps(event)}")
+    # Extract S3 event details
+    s3_event = record.get("s3", {})
+    bucket = s3_event.get("bucket", {}).get("name")
+    key = s3_event.get("object", {}).get("key")
     
-    results = []
+    if not bucket or not key:
+        logger.warning("Missing bucket or key in event record")
+        return None
+    
+    # URL decode the key (S3 events URL-encode special characters)
+    key = urllib.parse.unquote_plus(key)
     
-    for record in event.get("Records", []):
-        # Extract S3 event details
-        s3_event = record.get("s3", {})
-        bucket = s3_event.get("bucket", {}).get("name")
-        key = s3_event.get("object", {}).get("key")
+    logger.info("Processing file: s3://%s/%s", bucket, key)
+    
+    organization_id = "UNKNOWN"
+    timestamp = get_iso_timestamp()
+    audit_sk = generate_audit_sk(key)
+    events = []
+    
+    try:
+        # Get object metadata and tags
+        head_response, tags = get_object_metadata(bucket, key)
         
-        if not bucket or not key:
-            logger.warning("Missing bucket or key in event record")
-            continue
+        # Record upload event
+        events.append(build_audit_event(
+            event_type="UPLOAD",
+            timestamp=timestamp,
+            details={
+                "bucket": bucket,
+                "size": head_response.get("ContentLength", 0),
+                "tags": tags,
+            }
+        ))
         
-        # URL decode the key (S3 events URL-encode special characters)
-        import urllib.parse
-        key = urllib.parse.unquote_plus(key)
+        # Validate organization ID
+        organization_id = validate_organization_id(tags, head_response.get("Metadata", {}))
+        logger.info("Validated organization: %s", organization_id)
         
-        logger.info(f"Processing file: s3://{bucket}/{key}")
+        # Validate file requirements
+        file_metadata = validate_file_requirements(head_response, key)
+        logger.info("File validation passed: %s", file_metadata)
         
-        organization_id = "UNKNOWN"
+        # Record successful validation
+        events.append(build_audit_event(
+            event_type="VALIDATION",
+            timestamp=timestamp,
+            details={
+                "bucket": bucket,
+                "file_metadata": file_metadata,
+                "validation": "PASSED",
+            }
+        ))
+        record_audit_event(organization_id, key, audit_sk, events)
         
-        try:
-            # Get object metadata and tags
-            head_response, tags = get_object_metadata(bucket, key)
-            
-            # Record upload event
-            record_audit_event(
-                organization_id="PENDING",
-                event_type="UPLOAD",
-                file_key=key,
-                details={
-                    "bucket": bucket,
-                    "size": head_response.get("ContentLength", 0),
-                    "tags": tags,
-                }
-            )
-            
-            # Validate organization ID
-            organization_id = validate_organization_id(tags, head_response.get("Metadata", {}))
-            logger.info(f"Validated organization: {organization_id}")
-            
-            # Validate file requirements
-            file_metadata = validate_file_requirements(head_response, key)
-            logger.info(f"File validation passed: {file_metadata}")
-            
-            # Record successful validation
-            record_audit_event(
-                organization_id=organization_id,
-                event_type="VALIDATION",
-                file_key=key,
-                details={
-                    "bucket": bucket,
-                    "file_metadata": file_metadata,
-                    "validation": "PASSED",
-                }
-            )
-            
-            # Trigger processing task
-            task_arn = trigger_processing_task(bucket, key, organization_id, file_metadata)
-            
-            # Record processing start
-            record_audit_event(
-                organization_id=organization_id,
-                event_type="PROCESSING_START",
-                file_key=key,
-                details={
-                    "task_arn": task_arn,
-                    "cluster": ECS_CLUSTER_ARN,
-                }
-            )
-            
-            results.append({
-                "file": key,
-                "organization_id": organization_id,
-                "status": "PROCESSING_STARTED",
-                "task_arn": task_arn,
-            })
-            
-        except ValidationError as e:
-            logger.warning(f"Validation failed for {key}: {e}")
-            
-            # Record validation failure
-            record_audit_event(
-                organization_id=organization_id,
-                event_type="VALIDATION",
-                file_key=key,
-                details={
-                    "bucket": bucket,
-                    "error": str(e),
-                    "validation": "FAILED",
-                },
-                status="FAILURE"
-            )
-            
-            results.append({
-                "file": key,
-                "status": "VALIDATION_FAILED",
+        return {
+            "file": key,
+            "status": "VALIDATED",
+            "bucket": bucket,
+            "organization_id": organization_id,
+            "file_metadata": file_metadata,
+            "audit_sk": audit_sk,
+            "events": events,
+            "timestamp": timestamp,
+        }
+        
+    except ValidationError as e:
+        logger.warning("Validation failed for %s: %s", key, e)
+        
+        # Record validation failure
+        events.append(build_audit_event(
+            event_type="VALIDATION",
+            timestamp=timestamp,
+            details={
+                "bucket": bucket,
                 "error": str(e),
-            })
-            
-        except Exception as e:
-            logger.error(f"Error processing {key}: {e}")
-            
-            # Record error
-            record_audit_event(
-                organization_id=organization_id,
-                event_type="ERROR",
-                file_key=key,
-                details={
-                    "bucket": bucket,
-                    "error": str(e),
-                },
-                status="FAILURE"
-            )
-            
-            results.append({
-                "file": key,
-                "status": "ERROR",
+                "validation": "FAILED",
+            },
+            status="FAILURE"
+        ))
+        _record_failure_audit(organization_id, key, audit_sk, events)
+        
+        return {
+            "file": key,
+            "status": "VALIDATION_FAILED",
+            "error": str(e),
+        }
+        
+    except Exception as e:
+        logger.error("Error processing %s: %s", key, e)
+        
+        # Record error
+        events.append(build_audit_event(
+            event_type="ERROR",
+            timestamp=timestamp,
+            details={
+                "bucket": bucket,
                 "error": str(e),
-            })
+            },
+            status="FAILURE"
+        ))
+        _record_failure_audit(organization_id, key, audit_sk, events)
+        
+        return {
+            "file": key,
+            "status": "ERROR",
+            "error": str(e),
+        }
+
+
+def _start_processing(state: dict, audit_written: bool) -> dict:
+    """
+    Trigger the processing task for a validated record.
+    
+    The task is only started once the record's audit item has been written,
+    so the container always has an item to append to.
+    
+    Args:
+        state: VALIDATED entry returned by _validate_record()
+        audit_written: Whether the record's audit item was flushed
+        
+    Returns:
+        Result entry for the handler response
+    """
+    bucket = state["bucket"]
+    key = state["file"]
+    organization_id = state["organization_id"]
+    audit_sk = state["audit_sk"]
+    timestamp = state["timestamp"]
+    
+    try:
+        if not audit_written:
+            raise Exception("Audit item could not be written; processing task not started")
+        
+        # Trigger processing task
+        task_arn = trigger_processing_task(
+            bucket, key, organization_id, state["file_metadata"], audit_sk
+        )
+        
+    except Exception as e:
+        logger.error("Error processing %s: %s", key, e)
+        
+        # Record error; an unwritten item is written again in full
+        error_event = build_audit_event(
+            event_type="ERROR",
+            timestamp=timestamp,
+            details={
+                "bucket": bucket,
+                "error": str(e),
+            },
+            status="FAILURE"
+        )
+        if audit_written:
+            try:
+                append_audit_event(organization_id, key, audit_sk, error_event)
+            except Exception as audit_error:
+                logger.error("Audit trail not recorded for %s: %s", key, audit_error)
+        else:
+            _record_failure_audit(organization_id, key, audit_sk, state["events"] + [error_event])
+        
+        return {
+            "file": key,
+            "status": "ERROR",
+            "error": str(e),
+        }
+    
+    # Record processing start
+    try:
+        append_audit_event(organization_id, key, audit_sk, build_audit_event(
+            event_type="PROCESSING_START",
+            timestamp=timestamp,
+            details={
+                "task_arn": task_arn,
+                "cluster": ECS_CLUSTER_ARN,
+            }
+        ))
+    except Exception as e:
+        logger.error("Audit trail not recorded for %s: %s", key, e)
+    
+    return {
+        "file": key,
+        "organization_id": organization_id,
+        "status": "PROCESSING_STARTED",
+        "task_arn": task_arn,
+    }
+
+
+def lambda_handler(event: dict, context: Any) -> dict:
+    """
+    Main Lambda handler for S3 event processing.
+    
+    Records are independent, so they are processed concurrently in two
+    phases: all records are validated and their audit items batch-written,
+    then processing tasks are started for records whose item was written.
+    
+    Args:
+        event: S3 event notification
+        context: Lambda context
+        
+    Returns:
+        Response dict with processing status
+    """
+    records = event.get("Records", [])
+    logger.info("Received event with %d record(s)", len(records))
+    logger.debug("Received event: %s", event)
+    
+    if _AUDIT_BUFFER:
+        logger.error(
+            "Discarding %d unflushed audit items: %s",
+            len(_AUDIT_BUFFER), ", ".join(item["sk"]["S"] for item in _AUDIT_BUFFER)
+        )
+        _AUDIT_BUFFER.clear()
+    results = []
+    
+    try:
+        if records:
+            max_workers = min(MAX_RECORD_WORKERS, len(records))
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = [
+                    result for result in executor.map(_validate_record, records)
+                    if result is not None
+                ]
+                
+                # Audit items must exist before any container can append to them
+                unwritten = {item["sk"]["S"] for item in flush_audit_events()}
+                
+                validated = [
+                    index for index, result in enumerate(results)
+                    if result["status"] == "VALIDATED"
+                ]
+                started = executor.map(
+                    lambda state: _start_processing(state, state["audit_sk"] not in unwritten),
+                    [results[index] for index in validated]
+                )
+                for index, result in zip(validated, started):
+                    results[index] = result
+    finally:
+        # Persist any items still buffered if a record raised
+        flush_audit_events()
     
     return {
         "statusCode": 200,